@@ -1,9 +1,16 @@
 import asyncio
-import base64
+import binascii
+import hmac
 import os
+from contextlib import asynccontextmanager
+
+import httpx
+import pybase64
 from typing import Union # Import Union
-from fastapi import FastAPI, HTTPException, Security, Query, Response
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, FastAPI, HTTPException, Depends, Security, Query, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -12,24 +19,67 @@ from nextcloud_mcp import Ctx, from_env, NextcloudMcpError
 # Load environment variables at startup
 load_dotenv()
 
-app = FastAPI(
-    title="Nextcloud MCP API",
-    description="API to interact with Nextcloud for file and folder management.",
-    version="1.0.0",
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The connection pool lives for the whole process; close it cleanly on
+    # shutdown instead of relying on garbage collection.
+    yield
+    await nextcloud_ctx.aclose()
 
 # --- Bearer Token Authentication ---
 API_KEY = os.environ.get("API_KEY")
 if not API_KEY:
     raise RuntimeError("API_KEY environment variable not set. Please set it for authentication.")
 
-security_scheme = HTTPBearer()
+_API_KEY_BYTES = API_KEY.encode()
 
-async def get_api_key(credentials: HTTPAuthorizationCredentials = Security(security_scheme)):
-    if credentials.credentials == API_KEY:
-        return credentials.credentials
+# APIKeyHeader hands back the raw Authorization header without constructing
+# an HTTPAuthorizationCredentials model per request; the Bearer prefix is
+# parsed with a single startswith + slice.
+security_scheme = APIKeyHeader(name="Authorization", auto_error=True)
+
+async def get_api_key(authorization: str = Security(security_scheme)):
+    # Constant-time comparison avoids leaking the key through timing.
+    if authorization.startswith("Bearer ") and hmac.compare_digest(
+        authorization[7:].encode(), _API_KEY_BYTES
+    ):
+        return authorization
     raise HTTPException(status_code=403, detail="Could not validate credentials")
 
+app = FastAPI(
+    title="Nextcloud MCP API",
+    description="API to interact with Nextcloud for file and folder management.",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Binding the auth dependency once on the router applies it to every API
+# route without per-endpoint dependency graph resolution. The health check
+# stays on the app itself so probes don't need the bearer token.
+router = APIRouter(dependencies=[Depends(get_api_key)])
+
+# Compress the larger JSON payloads (base64 file bodies, big directory
+# listings) on the wire; small responses are passed through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Shared exception handlers so each endpoint doesn't wrap its body in the
+# same try/except blocks.
+@app.exception_handler(NextcloudMcpError)
+async def nextcloud_mcp_error_handler(request, exc: NextcloudMcpError):
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
+
+@app.exception_handler(httpx.TimeoutException)
+async def timeout_error_handler(request, exc: httpx.TimeoutException):
+    return ORJSONResponse(status_code=504, content={"detail": "Request to Nextcloud timed out"})
+
+# b64decode(..., validate=True) raises binascii.Error on malformed input
+# (including the whitespace/non-alphabet bytes stdlib's default ignores);
+# that's the client's fault, not the server's.
+@app.exception_handler(binascii.Error)
+async def base64_error_handler(request, exc: binascii.Error):
+    return ORJSONResponse(status_code=400, content={"detail": f"Invalid base64 content: {exc}"})
+
 # Initialize Ctx globally (or per request if preferred, but global is simpler for this example)
 # This will raise ConfigError if environment variables are not set
 try:
@@ -46,6 +96,9 @@ class SaveFileRequest(BaseModel):
     content: str  # Base64 encoded for binary, or plain text
     is_base64: bool = False
 
+class SaveFilesRequest(BaseModel):
+    files: list[SaveFileRequest]
+
 class PathRequest(BaseModel):
     path: str
 
@@ -67,130 +120,115 @@ class DirectoryItem(BaseModel):
     size: Union[int, None] = None
     last_modified: Union[str, None] = None # ISO 8601 string
     mime_type: Union[str, None] = None
+    href: Union[str, None] = None # Canonical server path for the item
 
 class DirectoryListingResponse(BaseModel):
     items: list[DirectoryItem]
 
-@app.post("/save_file", summary="Save a file to Nextcloud and get a public share link", dependencies=[Security(get_api_key)])
+@router.post("/save_file", summary="Save a file to Nextcloud and get a public share link")
 async def save_file_endpoint(request: SaveFileRequest):
-    try:
-        file_content = request.content
-        if request.is_base64:
-            file_content = base64.b64decode(request.content)
-
-        public_url = await nextcloud_ctx.save_file(request.path, file_content)
-        return {"message": "File saved and shared successfully", "public_url": public_url}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.get("/read_file", summary="Read a file from Nextcloud", response_model=ReadFileResponse, dependencies=[Security(get_api_key)])
-async def read_file_endpoint(path: str):
-    try:
-        content_bytes, mime_type = await nextcloud_ctx.read_file(path)
-        return {"content": base64.b64encode(content_bytes).decode('utf-8'), "mime_type": mime_type}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.put("/alter_file", summary="Alter (overwrite) a file in Nextcloud", dependencies=[Security(get_api_key)])
+    file_content = request.content
+    if request.is_base64:
+        file_content = pybase64.b64decode(request.content, validate=True)
+
+    public_url = await nextcloud_ctx.save_file(request.path, file_content)
+    return {"message": "File saved and shared successfully", "public_url": public_url}
+
+@router.post("/save_files_batch", summary="Save multiple files to Nextcloud and get public share links")
+async def save_files_batch_endpoint(request: SaveFilesRequest):
+    items = []
+    for file in request.files:
+        content = file.content
+        if file.is_base64:
+            content = pybase64.b64decode(file.content, validate=True)
+        items.append((file.path, content))
+
+    results = await nextcloud_ctx.save_files(items)
+
+    statuses = []
+    for file, result in zip(request.files, results):
+        if isinstance(result, Exception):
+            statuses.append({"path": file.path, "status": "error", "detail": str(result)})
+        else:
+            statuses.append({"path": file.path, "status": "ok", "public_url": result})
+    return {"results": statuses}
+
+@router.get("/read_file", summary="Read a file from Nextcloud", responses={200: {"model": ReadFileResponse}})
+async def read_file_endpoint(path: str, raw: bool = False):
+    content_bytes, mime_type = await nextcloud_ctx.read_file(path)
+    if raw:
+        # Skip the base64 round trip entirely: ~25% fewer bytes on the wire
+        # and no encode/decode CPU on either side.
+        return Response(
+            content=content_bytes,
+            media_type=mime_type,
+            headers={"Content-Disposition": f"attachment; filename=\"{os.path.basename(path)}\""},
+        )
+    return {"content": pybase64.b64encode(content_bytes).decode('ascii'), "mime_type": mime_type}
+
+@router.put("/alter_file", summary="Alter (overwrite) a file in Nextcloud")
 async def alter_file_endpoint(request: SaveFileRequest):
-    try:
-        file_content = request.content
-        if request.is_base64:
-            file_content = base64.b64decode(request.content)
-
-        # Reusing save_file as it overwrites existing files
-        await nextcloud_ctx.save_file(request.path, file_content)
-        return {"message": f"File '{request.path}' altered successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.get("/list_directory", summary="List contents of a directory in Nextcloud", response_model=DirectoryListingResponse, dependencies=[Security(get_api_key)])
+    file_content = request.content
+    if request.is_base64:
+        file_content = pybase64.b64decode(request.content, validate=True)
+
+    # Reusing save_file as it overwrites existing files
+    await nextcloud_ctx.save_file(request.path, file_content)
+    return {"message": f"File '{request.path}' altered successfully"}
+
+# No response_model here: Ctx.list_directory already returns dicts in the
+# DirectoryItem shape, so revalidating them through Pydantic per row would be
+# pure overhead. The model is kept in the OpenAPI schema via `responses`.
+@router.get("/list_directory", summary="List contents of a directory in Nextcloud", responses={200: {"model": DirectoryListingResponse}})
 async def list_directory_endpoint(path: str = "."):
-    try:
-        items = await nextcloud_ctx.list_directory(path)
-        return {"items": items}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.get("/download_folder_as_zip", summary="Download a folder from Nextcloud as a zip archive", dependencies=[Security(get_api_key)])
+    items = await nextcloud_ctx.list_directory(path)
+    return {"items": items}
+
+@router.get("/download_folder_as_zip", summary="Download a folder from Nextcloud as a zip archive")
 async def download_folder_as_zip_endpoint(path: str = Query(..., description="The path of the folder to download")):
-    try:
-        zip_content = await nextcloud_ctx.download_folder_as_zip(path)
-        return Response(content=zip_content, media_type="application/zip", headers={"Content-Disposition": f"attachment; filename=\"{path.split('/')[-1]}.zip\""})
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.post("/move_item", summary="Move or rename a file or folder in Nextcloud", dependencies=[Security(get_api_key)])
+    zip_content = await nextcloud_ctx.download_folder_as_zip(path)
+    return Response(content=zip_content, media_type="application/zip", headers={"Content-Disposition": f"attachment; filename=\"{path.split('/')[-1]}.zip\""})
+
+@router.post("/move_item", summary="Move or rename a file or folder in Nextcloud")
 async def move_item_endpoint(request: MoveItemRequest):
-    try:
-        await nextcloud_ctx.move_item(request.source_path, request.destination_path)
-        return {"message": f"Item moved/renamed from '{request.source_path}' to '{request.destination_path}' successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.post("/copy_item", summary="Copy a file or folder in Nextcloud", dependencies=[Security(get_api_key)])
+    await nextcloud_ctx.move_item(request.source_path, request.destination_path)
+    return {"message": f"Item moved/renamed from '{request.source_path}' to '{request.destination_path}' successfully"}
+
+@router.post("/copy_item", summary="Copy a file or folder in Nextcloud")
 async def copy_item_endpoint(request: CopyItemRequest):
-    try:
-        await nextcloud_ctx.copy_item(request.source_path, request.destination_path)
-        return {"message": f"Item copied from '{request.source_path}' to '{request.destination_path}' successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.post("/share_folder", summary="Share a folder in Nextcloud and get a public share link", dependencies=[Security(get_api_key)])
+    await nextcloud_ctx.copy_item(request.source_path, request.destination_path)
+    return {"message": f"Item copied from '{request.source_path}' to '{request.destination_path}' successfully"}
+
+@router.post("/share_folder", summary="Share a folder in Nextcloud and get a public share link")
 async def share_folder_endpoint(request: PathRequest):
-    try:
-        public_url = await nextcloud_ctx.share_folder(request.path)
-        return {"message": f"Folder '{request.path}' shared successfully", "public_url": public_url}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.post("/create_folder", summary="Create a folder in Nextcloud", dependencies=[Security(get_api_key)])
+    public_url = await nextcloud_ctx.share_folder(request.path)
+    return {"message": f"Folder '{request.path}' shared successfully", "public_url": public_url}
+
+@router.post("/create_folder", summary="Create a folder in Nextcloud")
 async def create_folder_endpoint(request: PathRequest):
-    try:
-        await nextcloud_ctx.create_folder(request.path)
-        return {"message": f"Folder '{request.path}' created successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.delete("/delete_file", summary="Delete a file from Nextcloud", dependencies=[Security(get_api_key)])
+    await nextcloud_ctx.create_folder(request.path)
+    return {"message": f"Folder '{request.path}' created successfully"}
+
+@router.delete("/delete_file", summary="Delete a file from Nextcloud")
 async def delete_file_endpoint(path: str = Query(..., description="The path of the file to delete")):
-    try:
-        await nextcloud_ctx.delete_file(path)
-        return {"message": f"File '{path}' deleted successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
-
-@app.delete("/delete_folder", summary="Delete a folder from Nextcloud", dependencies=[Security(get_api_key)])
+    await nextcloud_ctx.delete_file(path)
+    return {"message": f"File '{path}' deleted successfully"}
+
+@router.delete("/delete_folder", summary="Delete a folder from Nextcloud")
 async def delete_folder_endpoint(path: str = Query(..., description="The path of the folder to delete")):
-    try:
-        await nextcloud_ctx.delete_folder(path)
-        return {"message": f"Folder '{path}' deleted successfully"}
-    except NextcloudMcpError as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
+    await nextcloud_ctx.delete_folder(path)
+    return {"message": f"Folder '{path}' deleted successfully"}
 
 # Optional: Root endpoint for health check
 @app.get("/", summary="Health check")
 async def read_root():
     return {"status": "Nextcloud MCP API is running"}
+
+app.include_router(router)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop and httptools are the biggest single-server throughput levers for
+    # an I/O-bound proxy like this one.
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -9,6 +9,9 @@ class NextcloudConfig:
     username: str
     password: str
     usage_folder: str
+    # Keep-alive connections held by the HTTP client; concurrent batches are
+    # allowed to burst to twice this number.
+    pool_size: int = 32
 
 def from_env() -> NextcloudConfig:
     """
@@ -20,12 +23,20 @@ def from_env() -> NextcloudConfig:
         username = os.environ["NEXTCLOUD_USERNAME"]
         password = os.environ["NEXTCLOUD_PASSWORD"]
         usage_folder = os.environ.get("NEXTCLOUD_USAGE_FOLDER", "").strip('/')
+        pool_size_raw = os.environ.get("NEXTCLOUD_POOL_SIZE", "32")
+        try:
+            pool_size = int(pool_size_raw)
+        except ValueError as e:
+            raise ConfigError(
+                f"Environment variable NEXTCLOUD_POOL_SIZE must be an integer, got {pool_size_raw!r}."
+            ) from e
 
         return NextcloudConfig(
             instance_url=instance_url,
             username=username,
             password=password,
             usage_folder=usage_folder,
+            pool_size=pool_size,
         )
     except KeyError as e:
         raise ConfigError(f"Environment variable {e} is not set.") from e
\ No newline at end of file
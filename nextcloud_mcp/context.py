@@ -1,8 +1,22 @@
+import asyncio
+import io
+import os
+import time
+
 import httpx
-import xml.etree.ElementTree as ET # Re-import for WebDAV PROPFIND XML parsing
-from typing import Union
+import msgspec
+import orjson
+from typing import AsyncIterable, Union
+
+try:
+    from lxml import etree  # C-backed XML parsing for WebDAV PROPFIND responses
+    _HAVE_LXML = True
+except ImportError:  # pragma: no cover - exercised only where lxml is absent
+    import xml.etree.ElementTree as etree
+    _HAVE_LXML = False
 from .config import NextcloudConfig
 from .exceptions import (
+    NextcloudMcpError,
     UploadFailedError,
     ShareCreationFailedError,
     FolderCreationError,
@@ -11,34 +25,326 @@ from .exceptions import (
     DirectoryListingError,
     MoveRenameError,
     CopyError,
+    FolderDownloadError,
 )
 
+# Fully-qualified DAV tags for PROPFIND responses. The same strings work for
+# both lxml and the stdlib ElementTree fallback.
+_RESPONSE_TAG = "{DAV:}response"
+_HREF_TAG = "{DAV:}href"
+_PROPSTAT_TAG = "{DAV:}propstat"
+_PROP_TAG = "{DAV:}prop"
+
+_XML_PARSE_ERROR = etree.XMLSyntaxError if _HAVE_LXML else etree.ParseError
+
+if _HAVE_LXML:
+    def _iter_responses(content: bytes):
+        """Yields <d:response> elements, freeing each once it is consumed."""
+        for _, elem in etree.iterparse(io.BytesIO(content), tag=_RESPONSE_TAG):
+            yield elem
+            elem.clear()
+else:
+    def _iter_responses(content: bytes):
+        """Yields <d:response> elements from a fully-parsed tree."""
+        yield from etree.fromstring(content).iter(_RESPONSE_TAG)
+
+# Fully-qualified DAV property tags, dispatched on in a single pass over each
+# <d:prop> element's children.
+_DISPLAYNAME_TAG = "{DAV:}displayname"
+_CONTENTLENGTH_TAG = "{DAV:}getcontentlength"
+_LASTMODIFIED_TAG = "{DAV:}getlastmodified"
+_CONTENTTYPE_TAG = "{DAV:}getcontenttype"
+_RESOURCETYPE_TAG = "{DAV:}resourcetype"
+_COLLECTION_TAG = "{DAV:}collection"
+
+# Uploads at or above the threshold are handed to httpx as a chunk iterator so
+# the payload is pipelined onto the socket instead of copied in one piece.
+_UPLOAD_STREAM_THRESHOLD = 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Cap on concurrent requests issued by batch operations, so a large batch
+# stays within the client's connection pool.
+_BATCH_CONCURRENCY = 16
+
+# Chunk size for streaming downloads written to disk.
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Directory listings are cached briefly so repeated polls of the same folder
+# (agent retry loops, tool chains) don't each pay a PROPFIND round trip.
+_LISTING_CACHE_TTL = 5.0
+_LISTING_CACHE_MAX = 256
+
+# The read cache keeps whole file bodies resident, so it is bounded hard:
+# bodies over the size cutoff are never cached, and the least recently used
+# entry is evicted once the cache is full.
+_READ_CACHE_MAX_ENTRIES = 32
+_READ_CACHE_MAX_BODY = 1024 * 1024
+
+# PROPFIND request body asking for the properties list_directory surfaces,
+# pre-encoded once. Depth 1 limits the listing to direct children.
+_PROPFIND_BODY = b"""<?xml version="1.0"?>
+<d:propfind xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns" xmlns:nc="http://nextcloud.org/ns">
+  <d:prop>
+    <d:displayname/>
+    <d:getcontenttype/>
+    <d:getcontentlength/>
+    <d:getlastmodified/>
+    <d:resourcetype/>
+  </d:prop>
+</d:propfind>"""
+_PROPFIND_HEADERS = {"Content-Type": "application/xml", "Depth": "1"}
+
+# Static headers for OCS share creation POSTs; auth and OCS-APIRequest are
+# already carried by the client.
+_SHARE_HEADERS = {"Content-Type": "application/json"}
+
+
+# Typed views of the OCS share-creation envelope: msgspec parses and
+# validates the response in one C-level pass, with attribute access replacing
+# the chain of dict lookups.
+class _OcsMeta(msgspec.Struct):
+    statuscode: int = -1
+    message: str = "Unknown OCS API error."
+
+
+class _OcsShareData(msgspec.Struct):
+    url: str = ""
+
+
+class _OcsBody(msgspec.Struct):
+    meta: _OcsMeta = msgspec.field(default_factory=_OcsMeta)
+    data: _OcsShareData = msgspec.field(default_factory=_OcsShareData)
+
+
+class _OcsEnvelope(msgspec.Struct):
+    ocs: _OcsBody = msgspec.field(default_factory=_OcsBody)
+
+
+_OCS_DECODER = msgspec.json.Decoder(_OcsEnvelope)
+
+
+async def _iter_chunks(data: bytes) -> AsyncIterable[bytes]:
+    """Yields fixed-size chunks of data for streaming uploads."""
+    for start in range(0, len(data), _UPLOAD_CHUNK_SIZE):
+        yield data[start:start + _UPLOAD_CHUNK_SIZE]
+
+
+def _parse_propfind(content: bytes, href_prefix_len: int, skip_path: str) -> list[dict]:
+    """
+    Parses a PROPFIND multistatus body into list_directory item dicts.
+
+    A standalone function operating only on locals: the hot XML-to-dict
+    transform stays out of the async method and off instance attributes.
+
+    Args:
+        content: The raw multistatus response body.
+        href_prefix_len: Length of the fixed /remote.php/dav/files/<user>/
+            href prefix to slice off each entry.
+        skip_path: The listed directory's own relative path, excluded from
+            the results.
+    """
+    items = []
+    # Hoist the bound method so the loop pays one attribute lookup, not one
+    # per appended item.
+    append_item = items.append
+    for response_elem in _iter_responses(content):
+        # Pick up the href and the (first) propstat's prop in a single pass
+        # over the response children, instead of a namespaced lookup each.
+        href = ""
+        prop = None
+        for section in response_elem:
+            tag = section.tag
+            if tag == _HREF_TAG:
+                href = section.text or ""
+            elif tag == _PROPSTAT_TAG and prop is None:
+                prop = section.find(_PROP_TAG)
+
+        # One slice past the fixed WebDAV prefix recovers the path
+        # relative to the user's root; skip the directory itself.
+        rel_path = href[href_prefix_len:].rstrip('/')
+        if rel_path == skip_path or prop is None:
+            continue
+
+        # Collect every property in one pass over the children instead
+        # of a namespaced find() per property.
+        name = None
+        size_text = None
+        last_modified = None
+        mime_type = None
+        is_collection = False
+        for child in prop:
+            tag = child.tag
+            if tag == _DISPLAYNAME_TAG:
+                name = child.text
+            elif tag == _CONTENTLENGTH_TAG:
+                size_text = child.text
+            elif tag == _LASTMODIFIED_TAG:
+                last_modified = child.text or None
+            elif tag == _CONTENTTYPE_TAG:
+                mime_type = child.text or None
+            elif tag == _RESOURCETYPE_TAG:
+                for resource_child in child:
+                    if resource_child.tag == _COLLECTION_TAG:
+                        is_collection = True
+                        break
+
+        if name is None:
+            name = rel_path.rpartition('/')[2]
+
+        item_type = "folder" if is_collection else "file"
+
+        size = None
+        if not is_collection and size_text:
+            try:
+                size = int(size_text)
+            except ValueError:
+                pass # Ignore if size is not a valid integer
+
+        append_item({
+            "name": name,
+            "type": item_type,
+            "size": size,
+            "last_modified": last_modified,
+            "mime_type": mime_type,
+            # The canonical server path; callers can hand it straight back to
+            # delete/move/read without re-joining (and re-encoding) the name.
+            "href": href,
+        })
+    return items
+
 
 class Ctx:
     """The main context for interacting with the Nextcloud MCP."""
 
     def __init__(self, config: NextcloudConfig):
         self.config = config
+        # A single pooled HTTP/2 client multiplexes the many small WebDAV/OCS
+        # requests onto a few keep-alive connections instead of paying a
+        # TCP+TLS setup per call.
         self.client = httpx.AsyncClient(
             auth=(config.username, config.password),
             headers={
                 "OCS-APIRequest": "true",
                 "Accept": "application/json",
             },
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=config.pool_size,
+                    max_connections=config.pool_size * 2,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+        # Precompute the URL pieces that never change after construction so
+        # the per-request helpers are a single string concatenation.
+        self._instance_root = config.instance_url.rstrip('/')
+        self._webdav_base = (
+            f"{self._instance_root}/remote.php/dav/files/{config.username}/"
+        )
+        self._usage_prefix = (
+            f"{config.usage_folder.strip('/')}/" if config.usage_folder else ""
         )
+        self._share_api_url = (
+            f"{config.instance_url}/ocs/v2.php/apps/files_sharing/api/v1/shares"
+        )
+        # PROPFIND hrefs all start with this fixed prefix; its length lets
+        # list_directory recover the relative path with one slice.
+        self._href_prefix = f"/remote.php/dav/files/{config.username}/"
+        self._href_prefix_len = len(self._href_prefix)
+        # remote_path -> (monotonic timestamp, parsed items). All access
+        # happens on the event loop, so no locking is needed.
+        self._listing_cache: dict[str, tuple[float, list[dict]]] = {}
+        # remote_path -> public share URL. A share link stays valid across
+        # overwrites, so repeat saves of the same path can skip the OCS POST.
+        self._share_cache: dict[str, str] = {}
+        # remote_path -> (etag, content, mime type). Entries are revalidated
+        # with If-None-Match on every read, so they can never go stale; a 304
+        # just skips the body transfer.
+        self._read_cache: dict[str, tuple[str, bytes, str]] = {}
+
+    async def aclose(self):
+        """Closes the underlying HTTP client and its connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "Ctx":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
 
     def _get_remote_path(self, path: str) -> str:
-        """Constructs the full remote path including the usage_folder."""
-        sanitized_path = path.lstrip("/")
-        return (
-            f"{self.config.usage_folder}/{sanitized_path}"
-            if self.config.usage_folder
-            else sanitized_path
-        )
+        """
+        Constructs the full remote path including the usage_folder.
+
+        Hrefs from a previous listing and fully-qualified URLs are accepted,
+        but only when they point inside the configured usage folder of this
+        user's files root on the configured instance - they are normalized
+        back to a files-root-relative path (the form the OCS share API
+        expects). Anything else absolute is rejected: path values reach this
+        helper straight from API callers, and the shared client attaches the
+        Nextcloud credentials to every request it issues.
+        """
+        if path.startswith(("http://", "https://")):
+            if not path.startswith(self._webdav_base):
+                raise NextcloudMcpError(
+                    f"Path is outside the configured Nextcloud files root: {path}"
+                )
+            remote_path = path[len(self._webdav_base):]
+        elif path.startswith("/remote.php/dav/"):
+            if not path.startswith(self._href_prefix):
+                raise NextcloudMcpError(
+                    f"Path is outside the configured Nextcloud files root: {path}"
+                )
+            remote_path = path[self._href_prefix_len:]
+        else:
+            return self._usage_prefix + path.lstrip("/")
+
+        # Relative paths are confined under usage_folder by the prefix join
+        # above; qualified inputs must not sidestep that sandbox.
+        if self._usage_prefix and not remote_path.startswith(self._usage_prefix):
+            raise NextcloudMcpError(
+                f"Path is outside the configured usage folder: {path}"
+            )
+        return remote_path
 
     def _get_webdav_url(self, remote_path: str) -> str:
         """Constructs the full WebDAV URL for a given remote path."""
-        return f"{self.config.instance_url}/remote.php/dav/files/{self.config.username}/{remote_path}"
+        return self._webdav_base + remote_path
+
+    def invalidate_share(self, path: str):
+        """
+        Drops the cached public share link for a path.
+
+        Use when a share is revoked outside this client; deletes and moves
+        issued through Ctx already evict their entries.
+
+        Args:
+            path: The relative path whose cached share link to drop.
+        """
+        self._share_cache.pop(self._get_remote_path(path), None)
+
+    def _invalidate_listing(self, remote_path: str):
+        """Drops cached listings for the path and its parent directory."""
+        key = remote_path.rstrip("/")
+        self._listing_cache.pop(key, None)
+        self._listing_cache.pop(key.rpartition("/")[0], None)
+
+    def _evict_cached_paths(self, remote_path: str):
+        """
+        Drops share and read cache entries for a path and everything under it.
+
+        Deleting or moving a folder destroys the shares (and invalidates the
+        bodies) of all files inside, so child entries must go with it.
+        """
+        key = remote_path.rstrip("/")
+        prefix = key + "/"
+        for cache in (self._share_cache, self._read_cache):
+            cache.pop(key, None)
+            for cached_key in [k for k in cache if k.startswith(prefix)]:
+                del cache[cached_key]
 
     async def list_directory(self, path: str) -> list[dict]:
         """
@@ -53,78 +359,29 @@ class Ctx:
             and 'last_modified' (ISO 8601 string).
         """
         remote_path = self._get_remote_path(path)
-        list_url = self._get_webdav_url(remote_path)
+        cache_key = remote_path.rstrip("/")
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _LISTING_CACHE_TTL:
+            # Copy so callers can't mutate the cached listing.
+            return list(cached[1])
 
-        # WebDAV PROPFIND request body to ask for specific properties
-        propfind_body = """<?xml version="1.0"?>
-<d:propfind xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns" xmlns:nc="http://nextcloud.org/ns">
-  <d:prop>
-    <d:displayname/>
-    <d:getcontenttype/>
-    <d:getcontentlength/>
-    <d:getlastmodified/>
-    <d:resourcetype/>
-  </d:prop>
-</d:propfind>"""
-        headers = {"Content-Type": "application/xml", "Depth": "1"} # Depth 1 for direct children
+        list_url = self._get_webdav_url(remote_path)
 
         try:
-            response = await self.client.request("PROPFIND", list_url, content=propfind_body, headers=headers)
+            response = await self.client.request("PROPFIND", list_url, content=_PROPFIND_BODY, headers=_PROPFIND_HEADERS)
 
             if response.status_code not in [200, 207]: # 207 Multi-Status is common for PROPFIND
                 raise DirectoryListingError(
                     f"Failed to list directory with status {response.status_code}: {response.text}"
                 )
 
-            root = ET.fromstring(response.content)
-            # Define DAV: and Nextcloud: namespaces
-            ns = {'d': 'DAV:', 'nc': 'http://nextcloud.org/ns'}
-            
-            items = []
-            for response_elem in root.findall('d:response', ns):
-                href = response_elem.find('d:href', ns).text
-                # Skip the directory itself (href ending with /)
-                if href.rstrip('/').endswith(remote_path.rstrip('/')):
-                    continue
-
-                propstat = response_elem.find('d:propstat', ns)
-                prop = propstat.find('d:prop', ns)
-
-                name = prop.find('d:displayname', ns).text if prop.find('d:displayname', ns) is not None else href.split('/')[-2 if href.endswith('/') else -1]
-                
-                resource_type_elem = prop.find('d:resourcetype', ns)
-                is_collection = resource_type_elem is not None and resource_type_elem.find('d:collection', ns) is not None
-                
-                item_type = "folder" if is_collection else "file"
-                
-                size = None
-                if not is_collection:
-                    size_elem = prop.find('d:getcontentlength', ns)
-                    if size_elem is not None and size_elem.text:
-                        try:
-                            size = int(size_elem.text)
-                        except ValueError:
-                            pass # Ignore if size is not a valid integer
-
-                last_modified = None
-                last_modified_elem = prop.find('d:getlastmodified', ns)
-                if last_modified_elem is not None and last_modified_elem.text:
-                    last_modified = last_modified_elem.text # ISO 8601 string
-
-                mime_type = None
-                mime_type_elem = prop.find('d:getcontenttype', ns)
-                if mime_type_elem is not None and mime_type_elem.text:
-                    mime_type = mime_type_elem.text
-
-                items.append({
-                    "name": name,
-                    "type": item_type,
-                    "size": size,
-                    "last_modified": last_modified,
-                    "mime_type": mime_type,
-                })
-            return items
-        except ET.ParseError as e:
+            items = _parse_propfind(response.content, self._href_prefix_len, cache_key)
+
+            if len(self._listing_cache) >= _LISTING_CACHE_MAX:
+                self._listing_cache.clear()
+            self._listing_cache[cache_key] = (time.monotonic(), items)
+            return list(items)
+        except _XML_PARSE_ERROR as e:
             raise DirectoryListingError(f"Failed to parse PROPFIND XML response: {e}") from e
         except Exception as e:
             raise DirectoryListingError(f"An unexpected error occurred during directory listing: {e}") from e
@@ -153,6 +410,12 @@ class Ctx:
                 f"Failed to move/rename item with status {response.status_code}: {response.text}"
             )
 
+        self._invalidate_listing(remote_source_path)
+        self._invalidate_listing(remote_destination_path)
+        self._evict_cached_paths(remote_source_path)
+        # An overwritten destination loses its old shares and cached body too.
+        self._evict_cached_paths(remote_destination_path)
+
     async def copy_item(self, source_path: str, destination_path: str):
         """
         Copies a file or folder in Nextcloud.
@@ -177,10 +440,67 @@ class Ctx:
                 f"Failed to copy item with status {response.status_code}: {response.text}"
             )
 
+        self._invalidate_listing(remote_destination_path)
+        # As with MOVE, an overwritten destination loses its old shares and
+        # cached body.
+        self._evict_cached_paths(remote_destination_path)
+
+    async def download_folder_as_zip_to(
+        self, path: str, dest: Union[str, os.PathLike]
+    ) -> int:
+        """
+        Downloads a folder from Nextcloud as a zip archive, streaming to disk.
+
+        Memory stays bounded by the chunk size instead of the archive size.
+
+        Args:
+            path: The relative path for the folder to download.
+            dest: The local filesystem path to write the archive to.
+
+        Returns:
+            The number of bytes written.
+        """
+        remote_path = self._get_remote_path(path)
+        download_url = self._get_webdav_url(remote_path)
+
+        async with self.client.stream("GET", download_url) as response:
+            if response.status_code == 200:
+                if response.headers.get("Content-Type") != "application/zip":
+                    raise FolderDownloadError(f"Expected application/zip, but received {response.headers.get('Content-Type')}")
+                # httpx exposes no socket fd, so a kernel-side sendfile splice
+                # is off the table; the next best data path is raw chunks from
+                # the transport written straight to an fd, skipping the
+                # file-object layer. The blocking fd calls run in the default
+                # executor so a slow disk never stalls the event loop for
+                # other in-flight requests.
+                total = 0
+                fd = await asyncio.to_thread(
+                    os.open, dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+                )
+                try:
+                    if hasattr(os, "posix_fadvise"):
+                        # Hint sequential write-ahead to the kernel.
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    async for chunk in response.aiter_raw(_DOWNLOAD_CHUNK_SIZE):
+                        total += await asyncio.to_thread(os.write, fd, chunk)
+                finally:
+                    await asyncio.to_thread(os.close, fd)
+                return total
+            elif response.status_code == 404:
+                raise FolderDownloadError(f"Folder not found: {path}")
+            else:
+                await response.aread()
+                raise FolderDownloadError(
+                    f"Failed to download folder with status {response.status_code}: {response.text}"
+                )
+
     async def download_folder_as_zip(self, path: str) -> bytes:
         """
         Downloads a folder from Nextcloud as a zip archive.
 
+        Prefer download_folder_as_zip_to for large folders; this variant
+        buffers the whole archive in memory.
+
         Args:
             path: The relative path for the folder to download.
 
@@ -191,37 +511,98 @@ class Ctx:
         # Nextcloud provides a direct download link for folders as zip via WebDAV
         download_url = self._get_webdav_url(remote_path)
 
-        response = await self.client.get(download_url)
-
-        if response.status_code == 200:
-            # Nextcloud typically returns application/zip for folder downloads
-            if response.headers.get("Content-Type") == "application/zip":
-                return response.content
+        async with self.client.stream("GET", download_url) as response:
+            if response.status_code == 200:
+                # Nextcloud typically returns application/zip for folder downloads
+                if response.headers.get("Content-Type") != "application/zip":
+                    raise FolderDownloadError(f"Expected application/zip, but received {response.headers.get('Content-Type')}")
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer.extend(chunk)
+                return bytes(buffer)
+            elif response.status_code == 404:
+                raise FolderDownloadError(f"Folder not found: {path}")
             else:
-                raise FolderDownloadError(f"Expected application/zip, but received {response.headers.get("Content-Type")}")
-        elif response.status_code == 404:
-            raise FolderDownloadError(f"Folder not found: {path}")
-        else:
-            raise FolderDownloadError(
-                f"Failed to download folder with status {response.status_code}: {response.text}"
-            )
+                await response.aread()
+                raise FolderDownloadError(
+                    f"Failed to download folder with status {response.status_code}: {response.text}"
+                )
 
-    async def save_file(self, path: str, content: Union[bytes, str]) -> str:
+    async def save_file(
+        self, path: str, content: Union[bytes, str, AsyncIterable[bytes]]
+    ) -> str:
         """
         Saves a file to Nextcloud and returns a public share link.
 
         Args:
             path: The relative path for the file (e.g., "subfolder/data.txt").
-            content: The file content as bytes or a string.
+            content: The file content as bytes, a string, or an async iterator
+                of bytes chunks for streaming uploads.
 
         Returns:
             The public URL for the shared file.
         """
+        if isinstance(content, str):
+            # Encode once here rather than leaving the str for httpx's
+            # request builder to convert internally.
+            content = content.encode("utf-8")
+
         remote_path = self._get_remote_path(path)
         await self._upload_file_webdav(remote_path, content)
+        self._invalidate_listing(remote_path)
+
+        cached_url = self._share_cache.get(remote_path)
+        if cached_url is not None:
+            return cached_url
+
         public_url = await self._create_public_share(remote_path)
+        self._share_cache[remote_path] = public_url
         return public_url
 
+    async def batch(
+        self, coros, concurrency: int = 8, return_exceptions: bool = False
+    ) -> list:
+        """
+        Runs independent operations concurrently under a concurrency cap.
+
+        Args:
+            coros: An iterable of awaitables (typically Ctx method calls).
+            concurrency: Maximum number of operations in flight at once; keep
+                it within the client's connection pool.
+            return_exceptions: As for asyncio.gather.
+
+        Returns:
+            The results in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(
+            *(_run(coro) for coro in coros), return_exceptions=return_exceptions
+        )
+
+    async def save_files(
+        self, items: list[tuple[str, Union[bytes, str, AsyncIterable[bytes]]]]
+    ) -> list[Union[str, Exception]]:
+        """
+        Saves several files to Nextcloud concurrently.
+
+        Args:
+            items: A list of (path, content) pairs as accepted by save_file.
+
+        Returns:
+            A list with one entry per input item, in order: the public share
+            URL on success, or the exception raised for that item on failure.
+        """
+        return await self.batch(
+            (self.save_file(path, content) for path, content in items),
+            concurrency=_BATCH_CONCURRENCY,
+            return_exceptions=True,
+        )
+
     async def read_file(self, path: str) -> tuple[bytes, str]:
         """
         Reads a file from Nextcloud and returns its content and MIME type.
@@ -235,17 +616,43 @@ class Ctx:
         remote_path = self._get_remote_path(path)
         download_url = self._get_webdav_url(remote_path)
 
-        response = await self.client.get(download_url)
-
-        if response.status_code == 200:
-            content_type = response.headers.get("Content-Type", "application/octet-stream")
-            return response.content, content_type
-        elif response.status_code == 404:
-            raise FileReadError(f"File not found: {path}")
-        else:
-            raise FileReadError(
-                f"Failed to read file with status {response.status_code}: {response.text}"
+        cached = self._read_cache.get(remote_path)
+        if cached is not None:
+            stream = self.client.stream(
+                "GET", download_url, headers={"If-None-Match": cached[0]}
             )
+        else:
+            stream = self.client.stream("GET", download_url)
+
+        async with stream as response:
+            if response.status_code == 304 and cached is not None:
+                # Unchanged on the server; serve the cached body. Re-insert
+                # so hot paths aren't the first evicted.
+                if remote_path in self._read_cache:
+                    self._read_cache[remote_path] = self._read_cache.pop(remote_path)
+                return cached[1], cached[2]
+            if response.status_code == 200:
+                content_type = response.headers.get("Content-Type", "application/octet-stream")
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer.extend(chunk)
+                content = bytes(buffer)
+                etag = response.headers.get("ETag")
+                if etag and len(content) <= _READ_CACHE_MAX_BODY:
+                    self._read_cache.pop(remote_path, None)
+                    if len(self._read_cache) >= _READ_CACHE_MAX_ENTRIES:
+                        # Dicts keep insertion order and hits re-insert, so
+                        # the first key is the least recently used.
+                        del self._read_cache[next(iter(self._read_cache))]
+                    self._read_cache[remote_path] = (etag, content, content_type)
+                return content, content_type
+            elif response.status_code == 404:
+                raise FileReadError(f"File not found: {path}")
+            else:
+                await response.aread()
+                raise FileReadError(
+                    f"Failed to read file with status {response.status_code}: {response.text}"
+                )
 
     async def create_folder(self, path: str):
         """
@@ -254,7 +661,27 @@ class Ctx:
         Args:
             path: The relative path for the folder (e.g., "subfolder/new-folder").
         """
+        await self._mkcol(self._get_remote_path(path))
+
+    async def create_and_share_folder(self, path: str) -> str:
+        """
+        Creates a folder in Nextcloud and returns a public share link for it.
+
+        The MKCOL and share POST ride the same warm connection back-to-back,
+        without resolving the remote path twice.
+
+        Args:
+            path: The relative path for the folder.
+
+        Returns:
+            The public URL for the shared folder.
+        """
         remote_path = self._get_remote_path(path)
+        await self._mkcol(remote_path)
+        return await self._create_public_share(remote_path)
+
+    async def _mkcol(self, remote_path: str):
+        """Creates a collection at the given remote path via WebDAV MKCOL."""
         mkcol_url = self._get_webdav_url(remote_path)
 
         response = await self.client.request("MKCOL", mkcol_url)
@@ -265,6 +692,8 @@ class Ctx:
                 f"Failed to create folder with status {response.status_code}: {response.text}"
             )
 
+        self._invalidate_listing(remote_path)
+
     async def delete_file(self, path: str):
         """
         Deletes a file from Nextcloud.
@@ -296,13 +725,25 @@ class Ctx:
                 f"Deletion failed with status {response.status_code}: {response.text}"
             )
 
+        self._invalidate_listing(remote_path)
+        self._evict_cached_paths(remote_path)
+
     async def _upload_file_webdav(
-        self, remote_path: str, content: Union[bytes, str]
+        self, remote_path: str, content: Union[bytes, str, AsyncIterable[bytes]]
     ):
         """Uploads the file via WebDAV PUT request."""
         upload_url = self._get_webdav_url(remote_path)
 
-        response = await self.client.put(upload_url, content=content)
+        if isinstance(content, bytes) and len(content) >= _UPLOAD_STREAM_THRESHOLD:
+            # Stream large payloads in chunks; sending the known Content-Length
+            # lets the server preallocate instead of growing the target file.
+            response = await self.client.put(
+                upload_url,
+                content=_iter_chunks(content),
+                headers={"Content-Length": str(len(content))},
+            )
+        else:
+            response = await self.client.put(upload_url, content=content)
 
         # 201 = Created, 204 = Overwritten/No Content
         if response.status_code not in [201, 204]:
@@ -312,77 +753,44 @@ class Ctx:
 
     async def _create_public_share(self, remote_path: str) -> str:
         """Creates a public share link via the OCS API."""
-        share_api_url = (
-            f"{self.config.instance_url}/ocs/v2.php/apps/files_sharing/api/v1/shares"
-        )
-
-        payload = {
+        # Serialize the payload once with orjson and skip httpx's json=
+        # serializer dispatch.
+        body = orjson.dumps({
             "path": remote_path,
             "shareType": 3,  # 3 = Public Link
             "permissions": 1,  # 1 = Read-only
-        }
+        })
 
-        response = await self.client.post(share_api_url, json=payload)
+        response = await self.client.post(
+            self._share_api_url, content=body, headers=_SHARE_HEADERS
+        )
 
         if response.status_code != 200:
             raise ShareCreationFailedError(
                 f"Request to create share failed with status {response.status_code}: {response.text}"
             )
 
-        # Parse the JSON response
+        # Decode and validate the envelope in one pass
         try:
-            data = response.json()
-            ocs = data.get("ocs", {})
-            meta = ocs.get("meta", {})
-            status_code = meta.get("statuscode")
-
-            # Nextcloud OCS API returns status code 100 for success on creation
-            if status_code not in [100, 200]:
-                message = meta.get("message", "Unknown OCS API error.")
-                raise ShareCreationFailedError(
-                    f"OCS API Error: {message} (Code: {status_code})"
-                )
-
-            share_data = ocs.get("data", {})
-            share_url = share_data.get("url")
-
-            if not share_url:
-                raise ShareCreationFailedError(
-                    "Could not find public URL in OCS response."
-                )
-            return share_url
-        except (ValueError, KeyError) as e:
+            envelope = _OCS_DECODER.decode(response.content)
+        except msgspec.DecodeError as e:
             raise ShareCreationFailedError(
                 f"Failed to parse OCS API JSON response: {e}"
             ) from e
 
-    async def share_folder(self, path: str) -> str:
-        """
-        Shares a folder in Nextcloud and returns a public share link.
-
-        Args:
-            path: The relative path for the folder.
-
-        Returns:
-            The public URL for the shared folder.
-        """
-        remote_path = self._get_remote_path(path)
-        public_url = await self._create_public_share(remote_path)
-        return public_url
-
-    async def share_folder(self, path: str) -> str:
-        """
-        Shares a folder in Nextcloud and returns a public share link.
-
-        Args:
-            path: The relative path for the folder.
+        meta = envelope.ocs.meta
+        # Nextcloud OCS API returns status code 100 for success on creation
+        if meta.statuscode not in [100, 200]:
+            raise ShareCreationFailedError(
+                f"OCS API Error: {meta.message} (Code: {meta.statuscode})"
+            )
 
-        Returns:
-            The public URL for the shared folder.
-        """
-        remote_path = self._get_remote_path(path)
-        public_url = await self._create_public_share(remote_path)
-        return public_url
+        share_url = envelope.ocs.data.url
+        if not share_url:
+            raise ShareCreationFailedError(
+                "Could not find public URL in OCS response."
+            )
+        return share_url
 
     async def share_folder(self, path: str) -> str:
         """
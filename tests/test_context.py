@@ -1,7 +1,9 @@
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from nextcloud_mcp import Ctx, NextcloudConfig
 from nextcloud_mcp.exceptions import (
+    NextcloudMcpError,
     UploadFailedError,
     ShareCreationFailedError,
     FolderCreationError,
@@ -10,6 +12,7 @@ from nextcloud_mcp.exceptions import (
     DirectoryListingError,
     MoveRenameError,
     CopyError,
+    FolderDownloadError,
 )
 
 
@@ -24,14 +27,54 @@ def config():
     )
 
 
+@pytest.fixture(scope="module")
+def _client_mock():
+    """One AsyncMock shared by the module; construction is heavy, a reset is not."""
+    return AsyncMock()
+
+
 @pytest.fixture
-def ctx(config):
+def ctx(config, _client_mock):
     """Provides a Ctx instance with a mocked httpx client."""
+    _client_mock.reset_mock(return_value=True, side_effect=True)
     ctx_instance = Ctx(config)
-    ctx_instance.client = AsyncMock()
+    ctx_instance.client = _client_mock
     return ctx_instance
 
 
+def make_stream_response(status_code=200, chunks=(), headers=None, text=""):
+    """Builds a mock for client.stream(...) yielding the given body chunks."""
+    response = MagicMock(status_code=status_code, headers=headers or {}, text=text)
+
+    async def aiter_bytes(chunk_size=None):
+        for chunk in chunks:
+            yield chunk
+
+    response.aiter_bytes = aiter_bytes
+    response.aiter_raw = aiter_bytes
+    response.aread = AsyncMock(return_value=b"")
+    stream_cm = MagicMock()
+    stream_cm.__aenter__ = AsyncMock(return_value=response)
+    stream_cm.__aexit__ = AsyncMock(return_value=False)
+    return stream_cm
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_client(ctx):
+    """Tests that aclose closes the underlying HTTP client."""
+    await ctx.aclose()
+    ctx.client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_context_manager_closes_client(ctx):
+    """Tests that leaving the async context closes the HTTP client."""
+    async with ctx as entered:
+        assert entered is ctx
+        ctx.client.aclose.assert_not_awaited()
+    ctx.client.aclose.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_save_file_success(ctx, config):
     """Tests successful file saving and share link creation."""
@@ -41,12 +84,12 @@ async def test_save_file_success(ctx, config):
     # Mock the OCS Share API response
     mock_share_response = MagicMock(
         status_code=200,
-        json=lambda: {
+        content=orjson.dumps({
             "ocs": {
                 "meta": {"statuscode": 100},
                 "data": {"url": "https://test.nextcloud.com/s/sharelink"},
             }
-        },
+        }),
     )
     ctx.client.post.return_value = mock_share_response
 
@@ -58,18 +101,207 @@ async def test_save_file_success(ctx, config):
 
     # Verify WebDAV call
     expected_upload_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{file_path}"
-    ctx.client.put.assert_called_once_with(expected_upload_url, content=content)
+    ctx.client.put.assert_called_once_with(expected_upload_url, content=content.encode())
 
     # Verify OCS call
     expected_share_url = (
         f"{config.instance_url}/ocs/v2.php/apps/files_sharing/api/v1/shares"
     )
-    expected_payload = {
+    expected_payload = orjson.dumps({
         "path": f"{config.usage_folder}/{file_path}",
         "shareType": 3,
         "permissions": 1,
-    }
-    ctx.client.post.assert_called_once_with(expected_share_url, json=expected_payload)
+    })
+    ctx.client.post.assert_called_once_with(
+        expected_share_url,
+        content=expected_payload,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_file_reuses_cached_share_url(ctx):
+    """Tests that re-saving a path reuses the cached share link."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    first_url = await ctx.save_file("repeat.txt", "v1")
+    second_url = await ctx.save_file("repeat.txt", "v2")
+
+    assert first_url == second_url
+    assert ctx.client.put.call_count == 2
+    ctx.client.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_folder_evicts_child_share_cache(ctx):
+    """Tests that deleting a folder drops cached share links of its files."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    ctx.client.delete.return_value = MagicMock(status_code=204)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    await ctx.save_file("dir/a.txt", "v1")
+    await ctx.delete_folder("dir")
+    # Deleting the folder destroyed the share, so re-saving must re-POST.
+    await ctx.save_file("dir/a.txt", "v2")
+
+    assert ctx.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_move_item_evicts_destination_share_cache(ctx):
+    """Tests that moving onto a shared path drops the stale destination link."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    ctx.client.request.return_value = MagicMock(status_code=204)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    await ctx.save_file("dest.txt", "v1")
+    await ctx.move_item("src.txt", "dest.txt")
+    await ctx.save_file("dest.txt", "v2")
+
+    assert ctx.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_copy_item_evicts_destination_share_cache(ctx):
+    """Tests that copying onto a shared path drops the stale destination link."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    ctx.client.request.return_value = MagicMock(status_code=204)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    await ctx.save_file("dest.txt", "v1")
+    await ctx.copy_item("src.txt", "dest.txt")
+    await ctx.save_file("dest.txt", "v2")
+
+    assert ctx.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_share_forces_new_share_post(ctx):
+    """Tests that invalidate_share makes the next save recreate the link."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    await ctx.save_file("revoked.txt", "v1")
+    ctx.invalidate_share("revoked.txt")
+    await ctx.save_file("revoked.txt", "v2")
+
+    assert ctx.client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_save_file_streams_large_upload(ctx):
+    """Tests that uploads at or above the streaming threshold are chunked."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    content = b"x" * (1024 * 1024)
+    await ctx.save_file("big.bin", content)
+
+    kwargs = ctx.client.put.call_args.kwargs
+    assert kwargs["headers"] == {"Content-Length": str(len(content))}
+    chunks = [chunk async for chunk in kwargs["content"]]
+    assert all(len(chunk) <= 256 * 1024 for chunk in chunks)
+    assert b"".join(chunks) == content
+
+
+@pytest.mark.asyncio
+async def test_batch_preserves_order(ctx):
+    """Tests that batch returns results in input order under the cap."""
+    ctx.client.delete.return_value = MagicMock(status_code=204)
+    ctx.client.request.return_value = MagicMock(status_code=201)
+
+    results = await ctx.batch(
+        [
+            ctx.delete_file("a.txt"),
+            ctx.create_folder("b"),
+            ctx.delete_file("c.txt"),
+        ],
+        concurrency=2,
+    )
+
+    assert results == [None, None, None]
+    assert ctx.client.delete.call_count == 2
+    ctx.client.request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_save_files_mixed_results(ctx):
+    """Tests that save_files returns per-item results in input order."""
+    # First upload succeeds, second fails.
+    ctx.client.put.side_effect = [
+        MagicMock(status_code=201),
+        MagicMock(status_code=500, text="Server Error"),
+    ]
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    results = await ctx.save_files([("a.txt", "one"), ("b.txt", "two")])
+
+    assert results[0] == "https://test.nextcloud.com/s/sharelink"
+    assert isinstance(results[1], UploadFailedError)
 
 
 @pytest.mark.asyncio
@@ -102,9 +334,9 @@ async def test_share_creation_ocs_api_error(ctx):
     ctx.client.put.return_value = MagicMock(status_code=201)
     mock_share_response = MagicMock(
         status_code=200,
-        json=lambda: {
+        content=orjson.dumps({
             "ocs": {"meta": {"statuscode": 999, "message": "Invalid path"}}
-        },
+        }),
     )
     ctx.client.post.return_value = mock_share_response
 
@@ -120,7 +352,7 @@ async def test_share_creation_missing_url_in_response(ctx):
     ctx.client.put.return_value = MagicMock(status_code=201)
     mock_share_response = MagicMock(
         status_code=200,
-        json=lambda: {"ocs": {"meta": {"statuscode": 100}, "data": {}}},
+        content=orjson.dumps({"ocs": {"meta": {"statuscode": 100}, "data": {}}}),
     )
     ctx.client.post.return_value = mock_share_response
 
@@ -135,10 +367,12 @@ async def test_read_file_success(ctx, config):
     """Tests successful file reading."""
     mock_content = b"This is test content."
     mock_mime_type = "text/plain"
-    ctx.client.get.return_value = MagicMock(
-        status_code=200,
-        content=mock_content,
-        headers={"Content-Type": mock_mime_type},
+    ctx.client.stream = MagicMock(
+        return_value=make_stream_response(
+            status_code=200,
+            chunks=(mock_content,),
+            headers={"Content-Type": mock_mime_type},
+        )
     )
     file_path = "read_test.txt"
     content, mime_type = await ctx.read_file(file_path)
@@ -147,13 +381,81 @@ async def test_read_file_success(ctx, config):
     assert mime_type == mock_mime_type
 
     expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{file_path}"
-    ctx.client.get.assert_called_once_with(expected_url)
+    ctx.client.stream.assert_called_once_with("GET", expected_url)
+
+
+@pytest.mark.asyncio
+async def test_read_file_revalidates_with_etag(ctx, config):
+    """Tests that a 304 revalidation serves the cached body."""
+    mock_content = b"cached body"
+    first = make_stream_response(
+        status_code=200,
+        chunks=(mock_content,),
+        headers={"Content-Type": "text/plain", "ETag": '"abc123"'},
+    )
+    second = make_stream_response(status_code=304)
+    ctx.client.stream = MagicMock(side_effect=[first, second])
+
+    file_path = "etag_test.txt"
+    content1, mime1 = await ctx.read_file(file_path)
+    content2, mime2 = await ctx.read_file(file_path)
+
+    assert content1 == content2 == mock_content
+    assert mime1 == mime2 == "text/plain"
+
+    expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{file_path}"
+    second_call = ctx.client.stream.call_args_list[1]
+    assert second_call.args == ("GET", expected_url)
+    assert second_call.kwargs == {"headers": {"If-None-Match": '"abc123"'}}
+
+
+@pytest.mark.asyncio
+async def test_read_file_cache_skips_oversized_bodies(ctx):
+    """Tests that bodies over the cache cutoff are never cached."""
+    big = b"x" * (1024 * 1024 + 1)
+    responses = [
+        make_stream_response(
+            status_code=200,
+            chunks=(big,),
+            headers={"Content-Type": "application/octet-stream", "ETag": '"e1"'},
+        )
+        for _ in range(2)
+    ]
+    ctx.client.stream = MagicMock(side_effect=responses)
+
+    await ctx.read_file("big.bin")
+    await ctx.read_file("big.bin")
+
+    # No If-None-Match on the second read: nothing was cached.
+    assert ctx.client.stream.call_args_list[1].kwargs == {}
+
+
+@pytest.mark.asyncio
+async def test_read_file_cache_evicts_least_recently_used(ctx, monkeypatch):
+    """Tests that filling the cache evicts the oldest entry."""
+    monkeypatch.setattr("nextcloud_mcp.context._READ_CACHE_MAX_ENTRIES", 1)
+    responses = [
+        make_stream_response(
+            status_code=200,
+            chunks=(b"body",),
+            headers={"Content-Type": "text/plain", "ETag": f'"{n}"'},
+        )
+        for n in range(3)
+    ]
+    ctx.client.stream = MagicMock(side_effect=responses)
+
+    await ctx.read_file("a.txt")
+    await ctx.read_file("b.txt")  # evicts a.txt
+    await ctx.read_file("a.txt")
+
+    # The third read can't revalidate: a.txt's entry was evicted.
+    assert ctx.client.stream.call_args_list[2].kwargs == {}
 
 
 @pytest.mark.asyncio
 async def test_read_file_not_found(ctx):
     """Tests that FileReadError is raised when file is not found."""
-    ctx.client.get.return_value = MagicMock(status_code=404)
+    ctx.client.stream = MagicMock(return_value=make_stream_response(status_code=404))
     with pytest.raises(FileReadError, match="File not found: non_existent.txt"):
         await ctx.read_file("non_existent.txt")
 
@@ -161,13 +463,44 @@ async def test_read_file_not_found(ctx):
 @pytest.mark.asyncio
 async def test_read_file_failed(ctx):
     """Tests that FileReadError is raised on other read failures."""
-    ctx.client.get.return_value = MagicMock(status_code=500, text="Server Error")
+    ctx.client.stream = MagicMock(
+        return_value=make_stream_response(status_code=500, text="Server Error")
+    )
     with pytest.raises(
         FileReadError, match="Failed to read file with status 500: Server Error"
     ):
         await ctx.read_file("failed_read.txt")
 
 
+@pytest.mark.asyncio
+async def test_download_folder_as_zip_to_writes_file(ctx, config, tmp_path):
+    """Tests that the streaming zip download writes the archive to disk."""
+    chunks = (b"PK\x03\x04", b"zip-payload")
+    ctx.client.stream = MagicMock(
+        return_value=make_stream_response(
+            status_code=200,
+            chunks=chunks,
+            headers={"Content-Type": "application/zip"},
+        )
+    )
+    dest = tmp_path / "archive.zip"
+    written = await ctx.download_folder_as_zip_to("some_folder", dest)
+
+    assert written == len(b"".join(chunks))
+    assert dest.read_bytes() == b"".join(chunks)
+
+    expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/some_folder"
+    ctx.client.stream.assert_called_once_with("GET", expected_url)
+
+
+@pytest.mark.asyncio
+async def test_download_folder_as_zip_to_not_found(ctx, tmp_path):
+    """Tests that FolderDownloadError is raised when the folder is missing."""
+    ctx.client.stream = MagicMock(return_value=make_stream_response(status_code=404))
+    with pytest.raises(FolderDownloadError, match="Folder not found: missing"):
+        await ctx.download_folder_as_zip_to("missing", tmp_path / "x.zip")
+
+
 @pytest.mark.asyncio
 async def test_list_directory_success(ctx, config):
     """Tests successful directory listing."""
@@ -210,7 +543,7 @@ async def test_list_directory_success(ctx, config):
   </d:response>
 </d:multistatus>'''
 
-    expected_propfind_body = """<?xml version=\"1.0\"?>
+    expected_propfind_body = b"""<?xml version=\"1.0\"?>
 <d:propfind xmlns:d=\"DAV:\" xmlns:oc=\"http://owncloud.org/ns\" xmlns:nc=\"http://nextcloud.org/ns\">
   <d:prop>
     <d:displayname/>
@@ -249,6 +582,56 @@ async def test_list_directory_success(ctx, config):
     )
 
 
+@pytest.mark.asyncio
+async def test_list_directory_cached_within_ttl(ctx):
+    """Tests that a repeat listing within the TTL skips the PROPFIND."""
+    mock_xml_response = b'''<?xml version="1.0"?>
+<d:multistatus xmlns:d="DAV:">
+  <d:response>
+    <d:href>/remote.php/dav/files/testuser/TestUploads/cached_folder/</d:href>
+    <d:propstat>
+      <d:prop><d:resourcetype><d:collection/></d:resourcetype></d:prop>
+      <d:status>HTTP/1.1 200 OK</d:status>
+    </d:propstat>
+  </d:response>
+  <d:response>
+    <d:href>/remote.php/dav/files/testuser/TestUploads/cached_folder/file1.txt</d:href>
+    <d:propstat>
+      <d:prop>
+        <d:resourcetype/>
+        <d:displayname>file1.txt</d:displayname>
+      </d:prop>
+      <d:status>HTTP/1.1 200 OK</d:status>
+    </d:propstat>
+  </d:response>
+</d:multistatus>'''
+    ctx.client.request.return_value = MagicMock(
+        status_code=207, content=mock_xml_response
+    )
+
+    first = await ctx.list_directory("cached_folder")
+    second = await ctx.list_directory("cached_folder")
+
+    assert first == second
+    ctx.client.request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_list_directory_cache_invalidated_by_mutation(ctx):
+    """Tests that mutating a folder's contents drops its cached listing."""
+    ctx.client.request.return_value = MagicMock(
+        status_code=207,
+        content=b'<?xml version="1.0"?><d:multistatus xmlns:d="DAV:"></d:multistatus>',
+    )
+    ctx.client.delete.return_value = MagicMock(status_code=204)
+
+    await ctx.list_directory("watched_folder")
+    await ctx.delete_file("watched_folder/file.txt")
+    await ctx.list_directory("watched_folder")
+
+    assert ctx.client.request.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_list_directory_failed(ctx):
     """Tests that DirectoryListingError is raised on listing failure."""
@@ -284,16 +667,6 @@ async def test_move_item_failed(ctx):
         await ctx.move_item("source.txt", "dest.txt")
 
 
-@pytest.mark.asyncio
-async def test_move_item_failed(ctx):
-    """Tests that MoveRenameError is raised on move/rename failure."""
-    ctx.client.request.return_value = MagicMock(status_code=500, text="Server Error")
-    with pytest.raises(
-        MoveRenameError, match="Failed to move/rename item with status 500: Server Error"
-    ):
-        await ctx.move_item("source.txt", "dest.txt")
-
-
 @pytest.mark.asyncio
 async def test_copy_item_success(ctx, config):
     """Tests successful item copy."""
@@ -320,49 +693,39 @@ async def test_copy_item_failed(ctx):
 
 
 @pytest.mark.asyncio
-async def test_move_item_failed(ctx):
-    """Tests that MoveRenameError is raised on move/rename failure."""
-    ctx.client.request.return_value = MagicMock(status_code=500, text="Server Error")
-    with pytest.raises(
-        MoveRenameError, match="Failed to move/rename item with status 500: Server Error"
-    ):
-        await ctx.move_item("source.txt", "dest.txt")
-
-
-@pytest.mark.asyncio
-async def test_copy_item_success(ctx, config):
-    """Tests successful item copy."""
+async def test_create_folder_success(ctx, config):
+    """Tests successful folder creation."""
     ctx.client.request.return_value = MagicMock(status_code=201)
-    source_path = "original.txt"
-    destination_path = "copy.txt"
-    await ctx.copy_item(source_path, destination_path)
+    folder_path = "new-folder"
+    await ctx.create_folder(folder_path)
 
-    expected_source_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{source_path}"
-    expected_destination_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{destination_path}"
-    ctx.client.request.assert_called_once_with(
-        "COPY", expected_source_url, headers={"Destination": expected_destination_url}
-    )
+    expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{folder_path}"
+    ctx.client.request.assert_called_once_with("MKCOL", expected_url)
 
 
 @pytest.mark.asyncio
-async def test_copy_item_failed(ctx):
-    """Tests that CopyError is raised on copy failure."""
-    ctx.client.request.return_value = MagicMock(status_code=500, text="Server Error")
-    with pytest.raises(
-        CopyError, match="Failed to copy item with status 500: Server Error"
-    ):
-        await ctx.copy_item("source.txt", "dest.txt")
+async def test_create_and_share_folder_success(ctx, config):
+    """Tests folder creation followed by share link creation."""
+    ctx.client.request.return_value = MagicMock(status_code=201)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/folderlink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
 
+    folder_path = "shared-folder"
+    public_url = await ctx.create_and_share_folder(folder_path)
 
-@pytest.mark.asyncio
-async def test_create_folder_success(ctx, config):
-    """Tests successful folder creation."""
-    ctx.client.request.return_value = MagicMock(status_code=201)
-    folder_path = "new-folder"
-    await ctx.create_folder(folder_path)
+    assert public_url == "https://test.nextcloud.com/s/folderlink"
 
     expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/{folder_path}"
     ctx.client.request.assert_called_once_with("MKCOL", expected_url)
+    ctx.client.post.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -396,6 +759,69 @@ async def test_delete_file_success(ctx, config):
     ctx.client.delete.assert_called_once_with(expected_url)
 
 
+@pytest.mark.asyncio
+async def test_delete_file_accepts_dav_href(ctx, config):
+    """Tests that a server href from list_directory is used as-is."""
+    ctx.client.delete.return_value = MagicMock(status_code=204)
+    href = f"/remote.php/dav/files/{config.username}/{config.usage_folder}/from-listing.txt"
+    await ctx.delete_file(href)
+
+    ctx.client.delete.assert_called_once_with(f"{config.instance_url}{href}")
+
+
+@pytest.mark.asyncio
+async def test_delete_file_rejects_foreign_absolute_url(ctx):
+    """Tests that absolute URLs off the configured instance are refused."""
+    with pytest.raises(
+        NextcloudMcpError, match="outside the configured Nextcloud files root"
+    ):
+        await ctx.delete_file("https://attacker.example/exfil")
+    ctx.client.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_file_rejects_href_outside_usage_folder(ctx, config):
+    """Tests that an in-root href outside the usage folder is refused."""
+    href = f"/remote.php/dav/files/{config.username}/Documents/secret.txt"
+    with pytest.raises(
+        NextcloudMcpError, match="outside the configured usage folder"
+    ):
+        await ctx.delete_file(href)
+    ctx.client.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_file_path_starting_with_http_stays_relative(ctx, config):
+    """Tests that an ordinary name beginning with 'http' is not mistaken for a URL."""
+    ctx.client.delete.return_value = MagicMock(status_code=204)
+    await ctx.delete_file("httpd.conf")
+
+    expected_url = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/httpd.conf"
+    ctx.client.delete.assert_called_once_with(expected_url)
+
+
+@pytest.mark.asyncio
+async def test_save_file_with_qualified_url_shares_relative_path(ctx, config):
+    """Tests that a qualified URL is normalized before hitting the share API."""
+    ctx.client.put.return_value = MagicMock(status_code=201)
+    mock_share_response = MagicMock(
+        status_code=200,
+        content=orjson.dumps({
+            "ocs": {
+                "meta": {"statuscode": 100},
+                "data": {"url": "https://test.nextcloud.com/s/sharelink"},
+            }
+        }),
+    )
+    ctx.client.post.return_value = mock_share_response
+
+    qualified = f"{config.instance_url}/remote.php/dav/files/{config.username}/{config.usage_folder}/qualified.txt"
+    await ctx.save_file(qualified, "content")
+
+    share_payload = orjson.loads(ctx.client.post.call_args.kwargs["content"])
+    assert share_payload["path"] == f"{config.usage_folder}/qualified.txt"
+
+
 @pytest.mark.asyncio
 async def test_delete_file_not_found(ctx):
     """Tests that deleting a non-existent file is handled gracefully."""